@@ -16,7 +16,18 @@ create_numeric_test() {
     local MID_VAL=$7
     local TEST_VAL=$8
 
-    cat > "${TESTS_DIR}/integration_block_${TYPE_LOWER}.rs" << 'ENDFILE'
+    # Render the template with a single sed pass so the file is written once
+    sed \
+        -e "s/TYPE_LOWER/${TYPE_LOWER}/g" \
+        -e "s/TYPE_UPPER/${TYPE_UPPER}/g" \
+        -e "s/COLUMN_TYPE/${COLUMN_TYPE}/g" \
+        -e "s/CH_TYPE/${CH_TYPE}/g" \
+        -e "s/MIN_VAL/${MIN_VAL}/g" \
+        -e "s/MAX_VAL/${MAX_VAL}/g" \
+        -e "s/MID_VAL/${MID_VAL}/g" \
+        -e "s/TEST_VAL/${TEST_VAL}/g" \
+        -e "s/PROPTEST_STRATEGY/any::<${RUST_TYPE}>()/g" \
+        > "${TESTS_DIR}/integration_block_${TYPE_LOWER}.rs" << 'ENDFILE'
 /// Integration tests for TYPE_UPPER column using Block insertion
 mod common;
 
@@ -223,17 +234,6 @@ proptest! {
 }
 ENDFILE
 
-    # Replace placeholders
-    sed -i '' "s/TYPE_LOWER/${TYPE_LOWER}/g" "${TESTS_DIR}/integration_block_${TYPE_LOWER}.rs"
-    sed -i '' "s/TYPE_UPPER/${TYPE_UPPER}/g" "${TESTS_DIR}/integration_block_${TYPE_LOWER}.rs"
-    sed -i '' "s/COLUMN_TYPE/${COLUMN_TYPE}/g" "${TESTS_DIR}/integration_block_${TYPE_LOWER}.rs"
-    sed -i '' "s/CH_TYPE/${CH_TYPE}/g" "${TESTS_DIR}/integration_block_${TYPE_LOWER}.rs"
-    sed -i '' "s/MIN_VAL/${MIN_VAL}/g" "${TESTS_DIR}/integration_block_${TYPE_LOWER}.rs"
-    sed -i '' "s/MAX_VAL/${MAX_VAL}/g" "${TESTS_DIR}/integration_block_${TYPE_LOWER}.rs"
-    sed -i '' "s/MID_VAL/${MID_VAL}/g" "${TESTS_DIR}/integration_block_${TYPE_LOWER}.rs"
-    sed -i '' "s/TEST_VAL/${TEST_VAL}/g" "${TESTS_DIR}/integration_block_${TYPE_LOWER}.rs"
-    sed -i '' "s/PROPTEST_STRATEGY/any::<${RUST_TYPE}>()/g" "${TESTS_DIR}/integration_block_${TYPE_LOWER}.rs"
-
     echo "Created ${TESTS_DIR}/integration_block_${TYPE_LOWER}.rs"
 }
 